@@ -131,8 +131,12 @@ class GSAccount:
         year: str,
         school: str | None = None,
         entry_code_enabled: bool = False,
-    ) -> str:
-        """Create a course, and returns the course ID."""
+    ) -> GSCourse:
+        """Create a course, and return it.
+
+        The course is built from the creation response and added to the account, so it does not need to be
+        looked up again with `get_classes`.
+        """
         account_resp = self.session.get("https://www.gradescope.com/account")
         parsed_account_resp = BeautifulSoup(account_resp.text, "html.parser")
 
@@ -175,19 +179,15 @@ class GSAccount:
         if not course_id:
             raise HTMLParseError
 
-        course_id = course_id.group(1)
-
-        self.add_class(
-            GSCourse(
-                name=name,
-                nickname=nickname,
-                course_id=course_id,
-                year=f"{term} {year}",
-                session=self.session,
-            ),
-            is_instructor=True,
+        course = GSCourse(
+            name=name,
+            nickname=nickname,
+            course_id=course_id.group(1),
+            year=f"{term} {year}",
+            session=self.session,
         )
-        return course_id
+        self.add_class(course, is_instructor=True)
+        return course
 
     def __str__(self) -> str:
         string = []
@@ -4,6 +4,7 @@ import json
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -25,7 +26,7 @@ if TYPE_CHECKING:
     from pyscope.course import GSCourse
 
 
-@dataclass
+@dataclass(eq=False)
 class GSAssignment(RosterType):
     """An object that represents an assignment.
 
@@ -58,6 +59,7 @@ class GSAssignment(RosterType):
     course: GSCourse
 
     def __post_init__(self) -> None:
+        super().__post_init__()
         self.questions = Roster()
         self._loaded_questions = False
 
@@ -80,18 +82,7 @@ class GSAssignment(RosterType):
 
     def _find_question_parent(self, parent_id: str) -> GSQuestion | None:
         self._load_questions_if_needed()
-
-        def _find_recursive(curr_q: GSQuestion, parent_id: str) -> GSQuestion | None:
-            if curr_q.question_id == parent_id:
-                return curr_q
-            if curr_q.children:
-                for child in curr_q.children:
-                    found = _find_recursive(child, parent_id)
-                    if found:
-                        return found
-            return None
-
-        return _find_recursive(self.root, parent_id)
+        return self.root.find_id_recursive(parent_id)
 
     def get_question(
         self,
@@ -227,34 +218,17 @@ class GSAssignment(RosterType):
         question_ids: list[str] | None = None,
         question_titles: list[str] | None = None,
     ) -> list[GSQuestion]:
-        def _check_match(
-            question: GSQuestion,
-            question_id: str | None = None,
-            question_title: str | None = None,
-        ) -> bool:
-            is_match = False
-            if question_id:
-                is_match = is_match or bool(re.match(question_id, question.question_id))
-            if question_title:
-                is_match = is_match or bool(re.match(question_title, question.title))
-            return is_match
-
-        matched_questions = []
-        if question_ids is None:
-            question_ids = []
-        if question_titles is None:
-            question_titles = []
-
-        identifiers = [{"question_id": question_id} for question_id in question_ids] + [
-            {"question_title": question_title} for question_title in question_titles
+        # Compile each pattern once, rather than once per question.
+        id_patterns = [re.compile(question_id) for question_id in question_ids or () if question_id]
+        title_patterns = [re.compile(question_title) for question_title in question_titles or () if question_title]
+
+        return [
+            question
+            for question in self.questions.get_all()
+            if any(pattern.match(question.question_id) for pattern in id_patterns)
+            or any(pattern.match(question.title) for pattern in title_patterns)
         ]
 
-        all_questions = self.questions.get_all()
-        matched_questions = {
-            question for question in all_questions for identifier in identifiers if _check_match(question, **identifier)
-        }
-        return list(matched_questions)
-
     def remove_questions(
         self,
         *,
@@ -287,13 +261,12 @@ class GSAssignment(RosterType):
         file = Path(fname)
         authenticity_token = get_csrf_token(self.course)
 
-        submission_files = {"file": file.open("rb")}
-
-        self.session.post(
-            f"{self.url}/submission_batches",
-            files=submission_files,
-            headers={"x-csrf-token": authenticity_token},
-        )
+        with file.open("rb") as f:
+            self.session.post(
+                f"{self.url}/submission_batches",
+                files={"file": f},
+                headers={"x-csrf-token": authenticity_token},
+            )
 
     def add_student_submission(self, fname: str | Path, student_email: str) -> None:
         """Add a student submission for the assignment.
@@ -365,7 +338,7 @@ class GSAssignment(RosterType):
         unzip: bool = True,
         timeout: float = float("inf"),
         sleep_time: float = 1,
-        chunk_size: int = 8192,
+        chunk_size: int = 1 << 20,
         show_bar: bool = True,
     ) -> None:
         """Export the submissions to a zip file, and then download them.
@@ -377,7 +350,7 @@ class GSAssignment(RosterType):
             unzip (bool, optional): Whether to unzip the zip file. Defaults to True.
             timeout (float, optional): The timeout for the export and download. Defaults to infinity, i.e. no timeout.
             sleep_time (float, optional): The time to sleep between checking whether the download is complete.
-            chunk_size (int, optional): The size of each chunk. Defaults to 8192B.
+            chunk_size (int, optional): The size of each chunk. Defaults to 1MiB.
             show_bar (bool, optional): Whether to show a progress bar. Defaults to True.
 
         """
@@ -504,22 +477,21 @@ class GSAssignment(RosterType):
         self.root = GSQuestion.create_root(all_questions)
         self._loaded_questions = True
 
-    def _apply_extension(self, extension: GSExtension, student_email: str) -> None:
-        """Apply an extension to a student.
+    def _load_extension_form(self) -> tuple[dict[str, str], str]:
+        """Load the extension page, returning a map of student email to extension user ID and the CSRF token.
 
         Inspired by https://github.com/cs161-staff/gradescope-api/blob/master/src/gradescope_api/assignment.py.
         """
-        extension_url = f"{self.url}/extensions"
-        extension_resp = self.session.get(extension_url)
+        extension_resp = self.session.get(f"{self.url}/extensions")
         parsed_extension_resp = BeautifulSoup(extension_resp.text, "html.parser")
         props = parsed_extension_resp.find("li", {"data-react-class": "AddExtension"})["data-react-props"]
         data = json.loads(props)
+        # These are NOT the same as the students' data_ids
         students = {row["email"]: row["id"] for row in data.get("students", [])}
-        if student_email not in students:
-            msg = f"Could not find student with email {student_email}"
-            raise StudentNotFoundError(msg)
-        student_id = students[student_email]  # NOT the same as extension.student.data_id
         authenticity_token = parsed_extension_resp.find("meta", attrs={"name": "csrf-token"})["content"]
+        return students, authenticity_token
+
+    def _post_extension(self, extension: GSExtension, student_id: str, authenticity_token: str) -> None:
         new_settings = {"visible": True} | extension.get_extension_data(self)
         payload = {
             "override": {
@@ -531,7 +503,29 @@ class GSAssignment(RosterType):
             "x-csrf-token": authenticity_token,
             "Content-Type": "application/json",
         }
-        self.session.post(extension_url, headers=headers, data=json.dumps(payload), timeout=20)
+        self.session.post(f"{self.url}/extensions", headers=headers, data=json.dumps(payload), timeout=20)
+
+    def _apply_extensions(self, extensions: list[tuple[GSExtension, str]], max_workers: int = 1) -> None:
+        """Apply extensions to students, loading the extension page once for all of them."""
+        students, authenticity_token = self._load_extension_form()
+        # Check every student up front, so that no extension is applied if any student is missing.
+        for _, student_email in extensions:
+            if student_email not in students:
+                msg = f"Could not find student with email {student_email}"
+                raise StudentNotFoundError(msg)
+
+        if max_workers == 1 or len(extensions) == 1:
+            for extension, student_email in extensions:
+                self._post_extension(extension, students[student_email], authenticity_token)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._post_extension, extension, students[student_email], authenticity_token)
+                for extension, student_email in extensions
+            ]
+            for future in futures:
+                future.result()
 
     def apply_extension(self, extension: GSExtension, student_email: str) -> None:
         """Apply an extension to a student.
@@ -541,7 +535,19 @@ class GSAssignment(RosterType):
             student_email (str): The email of the student to apply the extension to.
 
         """
-        self._apply_extension(extension, student_email=student_email)
+        self._apply_extensions([(extension, student_email)])
+
+    def apply_extensions(self, extensions: list[tuple[GSExtension, str]], max_workers: int = 8) -> None:
+        """Apply several extensions at once.
+
+        The extension page is loaded once and the extensions are posted concurrently.
+
+        Args:
+            extensions (list[tuple[GSExtension, str]]): (extension, student email) for each extension to apply.
+            max_workers (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+        """
+        self._apply_extensions(extensions, max_workers=max_workers)
 
     def remove_extension(self, student_email: str) -> None:
         """Remove an extension from a student, by re-applying all default fields.
@@ -550,7 +556,7 @@ class GSAssignment(RosterType):
             student_email (str): The email of the student to remove the extension from.
 
         """
-        self._apply_extension(GSExtension(), student_email=student_email)
+        self._apply_extensions([(GSExtension(), student_email)])
 
     def format(self, prefix: str = "\t") -> str:
         """Return a string representation of the assignment."""
@@ -567,6 +573,4 @@ class GSAssignment(RosterType):
 
     def get_hard_due_date(self) -> datetime:
         """Get the hard due date of the assignment, if it exists."""
-        if self.hard_due_date:
-            return self.hard_due_date
-        return self.due_date
+        return self.hard_due_date or self.due_date
@@ -1,12 +1,31 @@
+import json
+import logging
+import os
+import re
+from pathlib import Path
+
 import requests
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from pyscope.account import GSAccount
 from pyscope.course import GSCourse
-from pyscope.exceptions import UninitializedAccountError
+from pyscope.exceptions import HTMLParseError, UninitializedAccountError
 from pyscope.pyscope_types import ConnState, CourseInfo, CourseSplit
 from pyscope.utils import SafeSession
 
+# Course boxes live in the element directly following each section's heading on the account page.
+_INSTRUCTOR_COURSES = soupsieve.compile("h1.pageHeading + * a.courseBox")
+_STUDENT_COURSES = soupsieve.compile('h2.pageHeading:-soup-contains-own("Student Courses") + * a.courseBox')
+# The authenticity token is the only thing needed from the landing page, so find its <input> tag in the login form
+# directly, then read the value from the tag; attributes may appear in any order.
+_LOGIN_AUTH_TOKEN_INPUT = re.compile(
+    rb"""<form\b[^>]*\saction=["']/login["'](?:(?!</form>).)*?"""
+    rb"""(<input\b(?=[^>]*\sname=["']?authenticity_token["'\s/>])[^>]*>)""",
+    re.DOTALL | re.IGNORECASE,
+)
+_ATTR_VALUE = re.compile(rb"""\svalue\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.IGNORECASE)
+
 
 class GSConnection:
     """Tracks the current session/connection to Gradescope."""
@@ -16,15 +35,30 @@ class GSConnection:
         self.state = ConnState.INIT
         self.account = None
 
+    @staticmethod
+    def _find_auth_token(init_resp: requests.Response) -> str:
+        input_match = _LOGIN_AUTH_TOKEN_INPUT.search(init_resp.content)
+        value_match = _ATTR_VALUE.search(input_match.group(1)) if input_match else None
+        if value_match is not None:
+            return next(value for value in value_match.groups() if value is not None).decode()
+
+        # Unusual markup; fall back to parsing the login form.
+        logging.debug("Falling back to parsing the login form for the authenticity token")
+        parsed_init_resp = BeautifulSoup(
+            init_resp.text,
+            "html.parser",
+            parse_only=SoupStrainer("form", action="/login"),
+        )
+        auth_input = parsed_init_resp.find("input", attrs={"name": "authenticity_token"})
+        if auth_input is None or auth_input.get("value") is None:
+            msg = "Could not find the authenticity token in the login form"
+            raise HTMLParseError(msg)
+        return auth_input.get("value")
+
     def _login(self, email: str, pswd: str) -> bool:
         login_success = False
         init_resp = self.session.get("https://www.gradescope.com/")
-        parsed_init_resp = BeautifulSoup(init_resp.text, "html.parser")
-        for form in parsed_init_resp.find_all("form"):
-            if form.get("action") == "/login":
-                for inp in form.find_all("input"):
-                    if inp.get("name") == "authenticity_token":
-                        auth_token = inp.get("value")
+        auth_token = self._find_auth_token(init_resp)
 
         login_data = {
             "utf8": "✓",
@@ -43,18 +77,53 @@ class GSConnection:
 
         return login_success
 
-    def _load_courses(self, split: CourseSplit = CourseSplit.ALL) -> list[CourseInfo]:
-        account_resp = self.session.get("https://www.gradescope.com/account")
+    def _restore_session(self, email: str, cookie_path: Path) -> requests.Response | None:
+        """Try to log in with cookies saved by `save_cookies`, returning the account page if they are still valid."""
+        if not cookie_path.exists():
+            return None
+        try:
+            cookies_loaded = self.load_cookies(cookie_path, email)
+        except (ValueError, KeyError, TypeError):
+            # A corrupt or partially written file; fall back to logging in with the password.
+            logging.debug("Could not read saved cookies from %s", cookie_path, exc_info=True)
+            cookies_loaded = False
+        if not cookies_loaded:
+            self.session.cookies.clear()
+            return None
+        # Logged-out requests for the account page are redirected to the login page.
+        account_resp = self.session.get("https://www.gradescope.com/account", allow_redirects=False)
+        if account_resp.status_code != requests.codes.ok:
+            logging.debug("Saved cookies for %s are no longer valid", email)
+            self.session.cookies.clear()
+            return None
+        self.state = ConnState.LOGGED_IN
+        self.account = GSAccount(email, self.session)
+        return account_resp
+
+    def _load_courses(
+        self,
+        split: CourseSplit = CourseSplit.ALL,
+        account_resp: requests.Response | None = None,
+    ) -> list[CourseInfo]:
+        if account_resp is None:
+            account_resp = self.session.get("https://www.gradescope.com/account")
         parsed_account_resp = BeautifulSoup(account_resp.text, "html.parser")
 
+        def _find_term(course_group: Tag) -> str | None:
+            for tag in course_group.previous_siblings:
+                if "courseList--term" in tag.get("class"):
+                    return tag.string
+            return None
+
         def _parse_courses(course_list: list, instructor: bool) -> list[CourseInfo]:
             parsed_courses = []
+            # Courses in the same term share a parent, so only walk back to its term header once per parent.
+            terms = {}
             for course in course_list:
-                year = None
-                for tag in course.parent.previous_siblings:
-                    if "courseList--term" in tag.get("class"):
-                        year = tag.string
-                        break
+                course_group = course.parent
+                if id(course_group) not in terms:
+                    terms[id(course_group)] = _find_term(course_group)
+                year = terms[id(course_group)]
                 parsed_courses.append(
                     GSCourse(
                         name=course.find("div", class_="courseBox--name").text,
@@ -68,45 +137,94 @@ class GSConnection:
 
         course_list = []
         if split in (CourseSplit.INSTRUCTOR, CourseSplit.ALL):
-            course_list += _parse_courses(
-                parsed_account_resp.find("h1", class_="pageHeading").next_sibling.find_all(
-                    "a",
-                    class_="courseBox",
-                ),
-                instructor=True,
-            )
+            course_list += _parse_courses(_INSTRUCTOR_COURSES.select(parsed_account_resp), instructor=True)
         if split in (CourseSplit.STUDENT, CourseSplit.ALL):
-            course_list += _parse_courses(
-                parsed_account_resp.find(
-                    "h2",
-                    class_="pageHeading",
-                    string="Student Courses",
-                ).next_sibling.find_all("a", class_="courseBox"),
-                instructor=False,
-            )
+            course_list += _parse_courses(_STUDENT_COURSES.select(parsed_account_resp), instructor=False)
         return course_list
 
-    def _load_account_data(self) -> None:
+    def _load_account_data(self, account_resp: requests.Response | None = None) -> None:
         if self.state != ConnState.LOGGED_IN:
             raise UninitializedAccountError
-        self.account.add_classes(self._load_courses())
+        self.account.add_classes(self._load_courses(account_resp=account_resp))
 
-    def login(self, email: str, password: str) -> bool:
+    def login(self, email: str, password: str, cookie_path: str | Path | None = None) -> bool:
         """Login to Gradescope and initialize the account.
 
         Args:
             email (str): The email of the account.
             password (str): The password of the account.
+            cookie_path (str or Path or None): If provided, first try to reuse the cookies saved at this path, only
+                logging in with the password if they are missing or expired. The session's cookies are saved there
+                after a successful login.
 
         Returns:
             bool: Whether the login was successful.
 
         """
-        login_success = self._login(email, password)
+        account_resp = None
+        if cookie_path is not None:
+            cookie_path = Path(cookie_path)
+            account_resp = self._restore_session(email, cookie_path)
+        login_success = account_resp is not None or self._login(email, password)
         if login_success:
-            self._load_account_data()
+            self._load_account_data(account_resp)
+            if cookie_path is not None:
+                self.save_cookies(cookie_path)
         return login_success
 
+    def save_cookies(self, path: str | Path) -> None:
+        """Save the session's cookies, so that a later connection can skip logging in.
+
+        The cookies are stored as JSON, and grant access to the account; keep the file private.
+
+        Args:
+            path (str or Path): The file to write the cookies to.
+
+        """
+        if self.state != ConnState.LOGGED_IN:
+            raise UninitializedAccountError
+        cookies = [
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "secure": cookie.secure,
+                "expires": cookie.expires,
+            }
+            for cookie in self.session.cookies
+        ]
+        # The mode passed to os.open only applies to new files, so also restrict an existing file before writing.
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        Path(path).chmod(0o600)
+        with os.fdopen(fd, "w") as cookie_file:
+            json.dump({"email": self.account.email, "cookies": cookies}, cookie_file)
+
+    def load_cookies(self, path: str | Path, email: str) -> bool:
+        """Load cookies saved by `save_cookies` into the session.
+
+        This does not check that the cookies are still valid; `login` with a `cookie_path` does.
+
+        Args:
+            path (str or Path): The file to read the cookies from.
+            email (str): The email of the account the cookies are expected to belong to.
+
+        Returns:
+            bool: Whether the cookies belonged to the account and were loaded.
+
+        Raises:
+            ValueError: If the file is not valid JSON.
+            KeyError: If the file has no saved cookies.
+            TypeError: If a saved cookie is malformed.
+
+        """
+        saved = json.loads(Path(path).read_text())
+        if not isinstance(saved, dict) or saved.get("email") != email:
+            return False
+        for cookie in saved["cookies"]:
+            self.session.cookies.set(**cookie)
+        return True
+
     @classmethod
     def get_course(
         cls,
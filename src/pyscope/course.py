@@ -1,19 +1,20 @@
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
 import click
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from pyscope.assignment import GSAssignment
 from pyscope.exceptions import HTMLParseError
 from pyscope.person import GSPerson, GSRole
 from pyscope.pyscope_types import CourseData, SubmissionType
 from pyscope.roster import Roster
-from pyscope.utils import get_csrf_token
+from pyscope.utils import get_csrf_token, parse_csrf_token
 
 
 @dataclass
@@ -45,11 +46,14 @@ class GSCourse:
         self._roster = Roster()
         self._assignments = Roster()
         self._currently_loaded = 0
+        self._url = f"https://www.gradescope.com/courses/{self.course_id}"
+        self._memberships_url = f"{self._url}/memberships"
+        self._assignments_url = f"{self._url}/assignments"
 
     @property
     def url(self) -> str:
         """Get the full URL of the course."""
-        return f"https://www.gradescope.com/courses/{self.course_id}"
+        return self._url
 
     def update_roster(self) -> None:
         """Update the person roster."""
@@ -83,29 +87,49 @@ class GSCourse:
             notify (bool, optional): Whether to notify the person via email. Defaults to False.
 
         """
-        self._load_necessary_data(CourseData.ROSTER)
-
-        authenticity_token = get_csrf_token(self)
-        person_params = {
-            "utf8": "✓",
-            "user[name]": name,
-            "user[email]": email,
-            "user[sid]": "" if sid is None else sid,
-            "course_membership[role]": role.value,
-            "button": "",
-        }
-        if notify:
-            person_params["notify_by_email"] = 1
-
-        self.session.post(
-            f"{self.url}/memberships",
-            data=person_params,
-            headers={"x-csrf-token": authenticity_token},
-        )
+        self._post_person(name, email, role, sid=sid, notify=notify, authenticity_token=get_csrf_token(self))
 
         # Wasteful, but post response does not include new person's data id
         self._currently_loaded &= ~CourseData.ROSTER
 
+    def add_people(
+        self,
+        people: list[tuple[str, str, GSRole, str | None]],
+        notify: bool = False,
+        max_workers: int = 8,
+    ) -> None:
+        """Add several people to the course at once.
+
+        The CSRF token is fetched once and the requests are issued concurrently. As with `add_person`, the roster
+        is invalidated, but only once after all requests have finished (even if some of them failed).
+
+        Args:
+            people (list[tuple[str, str, GSRole, str | None]]): (name, email, role, sid) for each person.
+            notify (bool, optional): Whether to notify the people via email. Defaults to False.
+            max_workers (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+        """
+        authenticity_token = get_csrf_token(self)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._post_person,
+                        name,
+                        email,
+                        role,
+                        sid=sid,
+                        notify=notify,
+                        authenticity_token=authenticity_token,
+                    )
+                    for name, email, role, sid in people
+                ]
+                for future in futures:
+                    future.result()
+        finally:
+            # Some people may have been added even if another request failed.
+            self._currently_loaded &= ~CourseData.ROSTER
+
     def remove_person(
         self,
         *,
@@ -119,7 +143,7 @@ class GSCourse:
 
         authenticity_token = get_csrf_token(self)
         remove_params = {"_method": "delete", "authenticity_token": authenticity_token}
-        person = self._roster.get_entity(name=name, uid=email, entity=person, raise_error=False)
+        person = self._find_person(name=name, email=email, person=person, raise_error=False)
         if ask_for_confirmation and not click.confirm(
             f"Found person:\n{person.format()}.\nAre you sure you want to remove?",
             default=False,
@@ -127,7 +151,7 @@ class GSCourse:
             return
 
         self.session.post(
-            f"https://www.gradescope.com/courses/{self.course_id}/memberships/{person.data_id}",
+            f"{self._memberships_url}/{person.data_id}",
             data=remove_params,
             headers={"x-csrf-token": authenticity_token},
         )
@@ -147,10 +171,10 @@ class GSCourse:
         role_params = {
             "course_membership[role]": new_role.value,
         }
-        person = self._roster.get_entity(name=name, uid=email, entity=person)
+        person = self._find_person(name=name, email=email, person=person)
 
         self.session.patch(
-            f"{self.url}/memberships/{person.data_id}/update_role",
+            f"{self._memberships_url}/{person.data_id}/update_role",
             data=role_params,
             headers={"x-csrf-token": authenticity_token},
         )
@@ -165,12 +189,12 @@ class GSCourse:
     ) -> GSPerson:
         """Get a person by name or email."""
         self._load_necessary_data(CourseData.ROSTER)
-        return self._roster.get_entity(name=name, uid=email, entity=person, raise_error=False)
+        return self._find_person(name=name, email=email, person=person, raise_error=False)
 
     def get_all_people(self) -> list[GSPerson]:
         """Get a list of all people in the course."""
         self._load_necessary_data(CourseData.ROSTER)
-        return self._roster.get_all()
+        return self._roster.get_all_list()
 
     def add_assignment(
         self,
@@ -200,7 +224,6 @@ class GSCourse:
 
         """
         template_file_path = Path(template_file_path)
-        self._load_necessary_data(CourseData.ASSIGNMENTS)
         authenticity_token = get_csrf_token(self)
 
         assignment_params = {
@@ -213,8 +236,8 @@ class GSCourse:
             "assignment[submission_type]": str(submission_type),
             "assignment[group_submission]": group_submissions,
         }
-        assignment_files = {"template_pdf": template_file_path.open("rb")}
-        self.session.post(f"{self.url}/assignments", files=assignment_files, data=assignment_params)
+        with template_file_path.open("rb") as template_file:
+            self.session.post(self._assignments_url, files={"template_pdf": template_file}, data=assignment_params)
 
         # Wasteful, but post response does not include new assignment ID
         self._currently_loaded &= ~CourseData.ASSIGNMENTS
@@ -238,7 +261,7 @@ class GSCourse:
             return
         remove_params = {"_method": "delete", "authenticity_token": authenticity_token}
 
-        self.session.post(f"{self.url}/assignments/{assignment.assignment_id}", data=remove_params)
+        self.session.post(f"{self._assignments_url}/{assignment.assignment_id}", data=remove_params)
 
         self._assignments.remove_entity(entity=assignment)
 
@@ -256,10 +279,60 @@ class GSCourse:
     def get_all_assignments(self) -> list[GSAssignment]:
         """Return all assignments in the course."""
         self._load_necessary_data(CourseData.ASSIGNMENTS)
-        return self._assignments.get_all()
+        return self._assignments.get_all_list()
 
     # ~~~~~~~~~~~~~~~~~~~~~~HOUSEKEEPING~~~~~~~~~~~~~~~~~~~~~~~~~
 
+    def _find_person(
+        self,
+        *,
+        name: str | None = None,
+        email: str | None = None,
+        person: GSPerson = None,
+        raise_error: bool = True,
+    ) -> GSPerson | None:
+        """Look up a person in the roster, going straight to the matching index when only a name or email is given."""
+        if person is None:
+            if email is not None and name is None:
+                return self._roster.get_by_uid(email, raise_error=raise_error)
+            if name is not None and email is None:
+                return self._roster.get_by_name(name, raise_error=raise_error)
+        return self._roster.get_entity(name=name, uid=email, entity=person, raise_error=raise_error)
+
+    def _cache_csrf_token(self, parsed_resp: BeautifulSoup) -> None:
+        """Store the CSRF token from an already-loaded course page, so mutations can skip fetching one."""
+        csrf_tokens = getattr(self.session, "csrf_tokens", None)
+        token = parse_csrf_token(parsed_resp)
+        if token and csrf_tokens is not None:
+            csrf_tokens[self.url] = token
+
+    def _post_person(
+        self,
+        name: str,
+        email: str,
+        role: GSRole,
+        *,
+        sid: str | None,
+        notify: bool,
+        authenticity_token: str,
+    ) -> None:
+        person_params = {
+            "utf8": "✓",
+            "user[name]": name,
+            "user[email]": email,
+            "user[sid]": "" if sid is None else sid,
+            "course_membership[role]": role.value,
+            "button": "",
+        }
+        if notify:
+            person_params["notify_by_email"] = 1
+
+        self.session.post(
+            self._memberships_url,
+            data=person_params,
+            headers={"x-csrf-token": authenticity_token},
+        )
+
     def _lazy_load_assignments(self) -> None:
         """Load the assignments.
 
@@ -268,8 +341,9 @@ class GSCourse:
         students and assignments loaded.
 
         """
-        assignment_resp = self.session.get(f"{self.url}/assignments")
+        assignment_resp = self.session.get(self._assignments_url)
         parsed_assignment_resp = BeautifulSoup(assignment_resp.text, "html.parser")
+        self._cache_csrf_token(parsed_assignment_resp)
         assignment_data = parsed_assignment_resp.findAll(
             "div",
             attrs={"data-react-class": "AssignmentsTable"},
@@ -291,22 +365,15 @@ class GSCourse:
             submissions = row["num_active_submissions"]
             percent_graded = row["grading_progress"]
 
-            release_date = (
-                datetime.fromisoformat(row["submission_window"]["release_date"])
-                if row["submission_window"]["release_date"]
-                else None
-            )
-            due_date = (
-                datetime.fromisoformat(row["submission_window"]["due_date"])
-                if row["submission_window"]["due_date"]
-                else None
-            )
-            hard_due_date = (
-                datetime.fromisoformat(row["submission_window"]["hard_due_date"])
-                if row["submission_window"]["hard_due_date"]
-                else due_date
-            )
-            time_limit = row["submission_window"]["time_limit"]
+            submission_window = row["submission_window"]
+            release_date = submission_window["release_date"]
+            due_date = submission_window["due_date"]
+            hard_due_date = submission_window["hard_due_date"]
+            time_limit = submission_window["time_limit"]
+
+            release_date = datetime.fromisoformat(release_date) if release_date else None
+            due_date = datetime.fromisoformat(due_date) if due_date else None
+            hard_due_date = datetime.fromisoformat(hard_due_date) if hard_due_date else due_date
 
             regrades_on = row["regrade_requests_possible"]
             self._assignments.add(
@@ -335,22 +402,21 @@ class GSCourse:
         students and assignments loaded.
 
         """
-        membership_resp = self.session.get(f"{self.url}/memberships")
-        parsed_membership_resp = BeautifulSoup(membership_resp.text, "html.parser")
+        membership_resp = self.session.get(self._memberships_url)
+        # Only the roster rows and the CSRF meta tag are needed, so skip building the rest of the (large) DOM.
+        parsed_membership_resp = BeautifulSoup(
+            membership_resp.text,
+            "html.parser",
+            parse_only=SoupStrainer(["meta", "tr"]),
+        )
+        self._cache_csrf_token(parsed_membership_resp)
 
-        roster_table = []
         for student_row in parsed_membership_resp.find_all("tr", class_="rosterRow"):
-            found_data = False
-            for td in student_row("td"):
-                if td.find("button", class_="rosterCell--editIcon"):
-                    roster_table.append(td.find("button", class_="rosterCell--editIcon"))
-                    found_data = True
-                    break
-            if not found_data:
+            student_data = student_row.find("button", class_="rosterCell--editIcon")
+            if student_data is None:
                 msg = "Could not parse roster data"
                 raise HTMLParseError(msg)
 
-        for student_data in roster_table:
             data_cm = json.loads(student_data.get("data-cm"))
             name = data_cm["full_name"]
             sid = data_cm.get("sid", None)
@@ -399,7 +465,7 @@ class GSCourse:
         authenticity_token = get_csrf_token(self)
         delete_params = {"_method": "delete", "authenticity_token": authenticity_token}
         self.session.post(
-            f"{self.url}",
+            self.url,
             data=delete_params,
             headers={
                 "referer": f"{self.url}/edit",
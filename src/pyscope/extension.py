@@ -22,18 +22,28 @@ EXTENSION_TYPES = {
     "limit_multipler": numeric,
 }
 
+# The payload keys Gradescope expects, and the position of each extension field's target among them.
+_PAYLOAD_KEYS = ("release_date", "due_date", "hard_due_date", "time_limit_minutes")
+_TIME_LIMIT_INDEX = 3
+_OVERRIDE_KEYS = {
+    "release_date": 0,
+    "due_date": 1,
+    "late_due_date": 2,
+    "time_limit_minutes": _TIME_LIMIT_INDEX,
+}
+_DELTA_KEYS = {
+    "release_delta": 0,
+    "due_delta": 1,
+    "late_due_delta": 2,
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class GSExtension:
     """A class modeling an extension to an assignment."""
 
     fields: dict[str, fieldtype] = field(default_factory=dict)
 
-    def _translate_key(self, key: str) -> str:
-        if key == "hard_due_date":
-            return "late_due_date"
-        return key
-
     def get_extension_data(self, assignment: GSAssignment) -> dict[str, str]:
         """Parse the extension data into the format expected by the Gradescope.
 
@@ -44,36 +54,37 @@ class GSExtension:
             dict: The extension data in the format expected by the Gradescope.
 
         """
-        data = {
-            "release_date": assignment.release_date,
-            "due_date": assignment.due_date,
-            "hard_due_date": assignment.hard_due_date if assignment.hard_due_date else assignment.due_date,
-            "time_limit_minutes": assignment.time_limit,
-        }
-
-        for key, value in data.items():
-            data[key] = self.fields.get(self._translate_key(key), value)
-
-        if "release_delta" in self.fields:
-            data["release_date"] += self.fields["release_delta"]
-        if "due_delta" in self.fields:
-            data["due_date"] += self.fields["due_delta"]
-        if "late_due_delta" in self.fields:
-            data["hard_due_date"] += self.fields["late_due_delta"]
-        if "limit_multipler" in self.fields:
-            data["time_limit_minutes"] = (
-                self.fields["limit_multipler"] * data["time_limit_minutes"] if data["time_limit_minutes"] else None
-            )
-
+        due_date = assignment.due_date
+        originals = (
+            assignment.release_date,
+            due_date,
+            assignment.hard_due_date or due_date,
+            assignment.time_limit,
+        )
+        values = list(originals)
+
+        # Overrides are applied before deltas/multipliers regardless of the order the fields were given in.
+        deltas = []
+        limit_multiplier = None
+        for key, value in self.fields.items():
+            if (index := _OVERRIDE_KEYS.get(key)) is not None:
+                values[index] = value
+            elif (index := _DELTA_KEYS.get(key)) is not None:
+                deltas.append((index, value))
+            elif key == "limit_multipler":
+                limit_multiplier = value
+
+        for index, delta in deltas:
+            values[index] += delta
+        if limit_multiplier is not None:
+            time_limit = values[_TIME_LIMIT_INDEX]
+            values[_TIME_LIMIT_INDEX] = limit_multiplier * time_limit if time_limit else None
+
+        # Only send the fields that actually differ from the assignment's defaults.
         formatted_data = {}
-        for k, v in data.items():
-            assignment_key = k if k != "time_limit_minutes" else "time_limit"
-            if v == getattr(assignment, assignment_key):
-                continue
-            if "date" in k:
-                formatted_data[k] = GSExtension.format_date(v)
-            else:
-                formatted_data[k] = v
+        for index, (key, value, original) in enumerate(zip(_PAYLOAD_KEYS, values, originals, strict=True)):
+            if value != original:
+                formatted_data[key] = value if index == _TIME_LIMIT_INDEX else GSExtension.format_date(value)
 
         return formatted_data
 
@@ -89,13 +100,17 @@ class GSExtension:
         """Create a new extension from the given fields, and performs type validation."""
 
         def _validate_kwargs() -> None:
-            if not set(fields) <= set(EXTENSION_TYPES):
-                msg = f"Invalid extension fields: {set(fields) - set(EXTENSION_TYPES)}"
-                raise ValueError(msg)
+            invalid_fields = set()
             invalid_types = []
             for k, v in fields.items():
-                if not isinstance(v, EXTENSION_TYPES[k]):
+                expected_type = EXTENSION_TYPES.get(k)
+                if expected_type is None:
+                    invalid_fields.add(k)
+                elif not isinstance(v, expected_type):
                     invalid_types.append(f"Invalid type for {k}: {type(v)}")
+            if invalid_fields:
+                msg = f"Invalid extension fields: {invalid_fields}"
+                raise ValueError(msg)
             if invalid_types:
                 msg = "Invalid types found:" + "\n\t".join(invalid_types)
                 raise TypeError(msg)
@@ -104,12 +119,13 @@ class GSExtension:
         return cls(fields=fields)
 
     @staticmethod
-    def format_date(date: str | datetime) -> str:
+    def format_date(date: str | datetime) -> dict[str, str]:
         """Return a string representation of a date."""
-        if isinstance(date, str):
+        # datetimes are the common case, so try them first rather than type-checking up front.
+        try:
+            time = f"{date.year:04d}-{date.month:02d}-{date.day:02d}T{date.hour:02d}:{date.minute:02d}"
+        except AttributeError:
+            if not isinstance(date, str):
+                raise TypeError from None
             time = date
-        elif isinstance(date, datetime):
-            time = date.strftime("%Y-%m-%dT%H:%M")
-        else:
-            raise TypeError
-        return {"type": "absolute", "value": f"{time}"}
+        return {"type": "absolute", "value": time}
@@ -19,19 +19,23 @@ class GSRole(Enum):
     @classmethod
     def from_str(cls, role: str) -> GSRole:
         """Return the GSRole corresponding to the string."""
-        return cls(role)
+        try:
+            return _STR_TO_ROLE[role]
+        except KeyError:
+            msg = f"Unknown role {role!r}; expected one of {list(_STR_TO_ROLE)}"
+            raise ValueError(msg) from None
 
     def to_str(self) -> str:
         """Return a string representation of the role."""
-        return {
-            GSRole.INSTRUCTOR: "Instructor",
-            GSRole.STUDENT: "Student",
-            GSRole.TA: "TA",
-            GSRole.READER: "Reader",
-        }[self]
+        return _ROLE_TO_STR[self.value]
 
 
-@dataclass
+# Indexed by GSRole.value.
+_ROLE_TO_STR = ("Student", "Instructor", "TA", "Reader")
+_STR_TO_ROLE = {role_str: GSRole(value) for value, role_str in enumerate(_ROLE_TO_STR)}
+
+
+@dataclass(slots=True, eq=False)
 class GSPerson(RosterType):
     """A person in a course - could be a student or instructor (or any role.)."""
 
@@ -39,7 +39,10 @@ class SubmissionType(Enum):
     PDF = 1
 
     def __str__(self) -> str:
-        return self.name.lower()
+        return _SUBMISSION_TYPE_TO_STR[self]
+
+
+_SUBMISSION_TYPE_TO_STR = {submission_type: submission_type.name.lower() for submission_type in SubmissionType}
 
 
 class CourseData(IntFlag):
@@ -52,6 +55,12 @@ class CourseData(IntFlag):
 class RosterType:
     """A generic entity that can be added to a roster."""
 
+    # Only the cached hash, so that slotted subclasses do not also get a per-instance __dict__.
+    __slots__ = ("_uid_hash",)
+
+    def __post_init__(self) -> None:
+        self._uid_hash = hash(self.get_unique_id())
+
     @abstractmethod
     def get_name(self) -> str:
         """Return the name/nickname of the entity; this need not be unique."""
@@ -69,7 +78,13 @@ class RosterType:
 
     def __hash__(self) -> int:
         """Return the hash of roster entity; the ID is unique, so it can be used."""
-        return hash(self.get_unique_id())
+        return self._uid_hash
+
+    def __eq__(self, other: object) -> bool:
+        """Compare roster entities of the same type by their unique ID, consistent with `__hash__`."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._uid_hash == other._uid_hash and self.get_unique_id() == other.get_unique_id()
 
 
 class QuestionType(Enum):
@@ -81,18 +96,19 @@ class QuestionType(Enum):
     @classmethod
     def str_to_enum(cls, s: str) -> QuestionType:
         """Return the enum corresponding to the string."""
-        return {
-            "FreeResponseQuestion": cls.FREE_RESPONSE,
-            "QuestionGroup": cls.QUESTION_GROUP,
-        }[s]
+        return _Q_STR_TO_ENUM[s]
 
     @classmethod
     def enum_to_str(cls, e: QuestionType) -> str:
         """Return the string representation of the enum."""
-        return {
-            cls.FREE_RESPONSE: "FreeResponseQuestion",
-            cls.QUESTION_GROUP: "QuestionGroup",
-        }[e]
+        return _Q_ENUM_TO_STR[e]
 
     def __str__(self) -> str:
-        return self.enum_to_str(self)
+        return _Q_ENUM_TO_STR[self]
+
+
+_Q_STR_TO_ENUM = {
+    "FreeResponseQuestion": QuestionType.FREE_RESPONSE,
+    "QuestionGroup": QuestionType.QUESTION_GROUP,
+}
+_Q_ENUM_TO_STR = {e: s for s, e in _Q_STR_TO_ENUM.items()}
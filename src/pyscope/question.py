@@ -4,8 +4,10 @@ from dataclasses import dataclass
 
 from pyscope.pyscope_types import Crop, QuestionType, RosterType
 
+_ROOT_TITLE = "__ROOT__"
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class GSQuestion(RosterType):
     """A question in a Gradescope assignment."""
 
@@ -32,29 +34,46 @@ class GSQuestion(RosterType):
 
     def serialize(self) -> dict:
         """Serialize the question to a JSON dictionary that Gradescope can interpret."""
-        children = [child.serialize() for child in self.children]
-        return {
-            "id": self.question_id,
-            "title": self.title,
-            "weight": self.weight,
-            "crop_rect_list": self.crop,
-            "children": children,
-            "content": self.content,
-        }
+        # Reversing a pre-order walk visits every child before its parent, so each node's children are
+        # already serialized by the time the node itself is.
+        pre_order = []
+        stack = [self]
+        while stack:
+            question = stack.pop()
+            pre_order.append(question)
+            stack.extend(question.children)
+
+        serialized = {}
+        for question in reversed(pre_order):
+            children = [serialized[id(child)] for child in question.children]
+            # The root only exists to hold the top-level questions; everything else on it is None.
+            if question.question_id is None and question.title == _ROOT_TITLE:
+                serialized[id(question)] = {"children": children}
+                continue
+            question_data = {
+                "id": question.question_id,
+                "title": question.title,
+                "weight": question.weight,
+                "crop_rect_list": question.crop,
+            }
+            # Leaf questions are sent without a children key, as Gradescope itself does in the outline.
+            if children:
+                question_data["children"] = children
+            question_data["content"] = question.content
+            serialized[id(question)] = question_data
+        return serialized[id(self)]
 
     def find_id_recursive(self, question_id: str) -> GSQuestion | None:
         """Check the subtree rooted at this question for a question with the given id."""
-        if self.question_id == question_id:
-            return self
-        for child in self.children:
-            found = child.find_id_recursive(question_id)
-            if found:
-                return found
+        stack = [self]
+        while stack:
+            question = stack.pop()
+            if question.question_id == question_id:
+                return question
+            # Reversed so that children are visited in order, matching a recursive pre-order search.
+            stack.extend(reversed(question.children))
         return None
 
-    def __hash__(self) -> int:
-        return hash(self.question_id)
-
     @classmethod
     def create_root(cls, children: list[GSQuestion]) -> GSQuestion:
         """Return a root question with the given children.
@@ -63,7 +82,7 @@ class GSQuestion(RosterType):
         """
         return cls(
             question_id=None,
-            title="__ROOT__",
+            title=_ROOT_TITLE,
             weight=None,
             children=children,
             type=None,
@@ -1,39 +1,64 @@
+import sys
+from collections import defaultdict
+from collections.abc import ValuesView
+
 from pyscope.pyscope_types import UID, RosterType
 
 
+def _uid_key(uid: UID) -> UID:
+    """Intern string UIDs, so that repeated lookups of the same UID can match on identity."""
+    return sys.intern(uid) if isinstance(uid, str) else uid
+
+
 class Roster:
     """A generic roster of entities.
 
     Each entity subclasses RosterType and thus has both a name (not necessarily unique) and a unique identifier.
     A Roster can store students, assignments, etc.
+
+    Entities are indexed in dicts by both name and UID, so `get_entity`/`remove_entity` are O(1) regardless of
+    roster size; callers should go through the roster rather than maintaining their own lookup tables.
+    The name index is only built the first time an entity is accessed by name, so rosters that are only
+    ever accessed by UID never pay for it.
     """
 
+    __slots__ = ("_name_to_entity", "_uid_to_entity")
+
     def __init__(self) -> None:
         """Initialize the roster."""
-        self._name_to_entity: dict[str, RosterType] = {}
+        # Entities sharing a name are keyed by UID, so that any one of them can be removed directly.
+        self._name_to_entity: defaultdict[str, dict[UID, RosterType]] | None = None
         self._uid_to_entity: dict[UID, RosterType] = {}
 
     def add(self, entity: RosterType) -> None:
         """Add an entity to the roster."""
-        if entity.get_unique_id() in self._uid_to_entity:
-            msg = f"UID {entity.get_unique_id()} already in roster"
+        uid = _uid_key(entity.get_unique_id())
+        if uid in self._uid_to_entity:
+            msg = f"UID {uid} already in roster"
             raise ValueError(msg)
-        if entity.get_name() not in self._name_to_entity:
-            self._name_to_entity[entity.get_name()] = []
-        self._name_to_entity[entity.get_name()].append(entity)
-        self._uid_to_entity[entity.get_unique_id()] = entity
+        if self._name_to_entity is not None:
+            self._name_to_entity[entity.get_name()][uid] = entity
+        self._uid_to_entity[uid] = entity
+
+    def _get_name_index(self) -> defaultdict[str, dict[UID, RosterType]]:
+        if self._name_to_entity is None:
+            self._name_to_entity = defaultdict(dict)
+            for uid, entity in self._uid_to_entity.items():
+                self._name_to_entity[entity.get_name()][uid] = entity
+        return self._name_to_entity
 
     def _access_with_name(
         self,
         name: str,
         raise_error: bool = True,
     ) -> RosterType | None:
-        if name not in self._name_to_entity:
+        name_to_entity = self._get_name_index()
+        if name not in name_to_entity:
             if raise_error:
                 msg = "Name not in roster"
                 raise ValueError(msg)
             return None
-        named_entities = self._name_to_entity[name]
+        named_entities = name_to_entity[name]
         if len(named_entities) > 1:
             if raise_error:
                 msg = f"Ambiguous access - multiple entities with name {name}. \
@@ -42,19 +67,18 @@ class Roster:
                     msg,
                 )
             return None
-        return named_entities[0]
+        return next(iter(named_entities.values()))
 
     def _access_with_uid(
         self,
         uid: UID,
         raise_error: bool = True,
     ) -> RosterType | None:
-        if uid not in self._uid_to_entity:
-            if raise_error:
-                msg = "UID not in roster"
-                raise ValueError(msg)
-            return None
-        return self._uid_to_entity[uid]
+        entity = self._uid_to_entity.get(_uid_key(uid))
+        if entity is None and raise_error:
+            msg = "UID not in roster"
+            raise ValueError(msg)
+        return entity
 
     def _access(
         self,
@@ -64,15 +88,16 @@ class Roster:
         entity: RosterType = None,
         raise_error: bool = True,
     ) -> RosterType | None:
-        num_provided_fields = bool(name) + bool(uid) + bool(entity)
+        # Compare against None so that falsy identifiers (e.g. a UID of 0) still count as provided.
+        num_provided_fields = (name is not None) + (uid is not None) + (entity is not None)
         if num_provided_fields != 1:
             if raise_error:
                 msg = "Must provide exactly one of name, uid, or entity"
                 raise ValueError(msg)
             return None
-        if name:
+        if name is not None:
             entity = self._access_with_name(name, raise_error)
-        elif uid:
+        elif uid is not None:
             entity = self._access_with_uid(uid, raise_error)
         return entity
 
@@ -99,14 +124,21 @@ class Roster:
             bool: True if the entity was found and removed, False otherwise.
 
         """
-        entity = self._access(name=name, uid=uid, entity=entity, raise_error=raise_error)
-        if not entity:
-            return False
-        del self._uid_to_entity[entity.get_unique_id()]
-        if len(self._name_to_entity[entity.get_name()]) == 1:
-            del self._name_to_entity[entity.get_name()]
+        if entity is not None and name is None and uid is None:
+            # Resolve the entity through its UID, so that entities not in this roster are not "removed".
+            entity = self.get_by_uid(entity.get_unique_id(), raise_error=raise_error)
         else:
-            self._name_to_entity[entity.get_name()].remove(entity)
+            entity = self._access(name=name, uid=uid, entity=entity, raise_error=raise_error)
+        if entity is None:
+            return False
+        uid = _uid_key(entity.get_unique_id())
+        del self._uid_to_entity[uid]
+        if self._name_to_entity is not None:
+            name = entity.get_name()
+            named_entities = self._name_to_entity[name]
+            del named_entities[uid]
+            if not named_entities:
+                del self._name_to_entity[name]
         return True
 
     def get_entity(
@@ -134,8 +166,29 @@ class Roster:
         """
         return self._access(name=name, uid=uid, entity=entity, raise_error=raise_error)
 
-    def get_all(self) -> list[RosterType]:
-        """Return a list of all entities in the roster."""
+    def get_by_uid(self, uid: UID, raise_error: bool = True) -> RosterType | None:
+        """Return the entity with the given unique identifier.
+
+        Equivalent to `get_entity(uid=uid)`, without validating which kind of identifier was provided.
+        """
+        return self._access_with_uid(uid, raise_error)
+
+    def get_by_name(self, name: str, raise_error: bool = True) -> RosterType | None:
+        """Return the unique entity with the given name.
+
+        Equivalent to `get_entity(name=name)`, without validating which kind of identifier was provided.
+        """
+        return self._access_with_name(name, raise_error)
+
+    def get_all(self) -> ValuesView[RosterType]:
+        """Return a read-only, live view of all entities in the roster.
+
+        The view must not be iterated while the roster is being modified; use `get_all_list` for a snapshot.
+        """
+        return self._uid_to_entity.values()
+
+    def get_all_list(self) -> list[RosterType]:
+        """Return a list snapshot of all entities in the roster."""
         return list(self._uid_to_entity.values())
 
     def __len__(self) -> int:
@@ -143,5 +196,5 @@ class Roster:
 
     def clear(self) -> None:
         """Clear the roster."""
-        self._name_to_entity = {}
+        self._name_to_entity = None
         self._uid_to_entity = {}
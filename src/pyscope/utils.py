@@ -2,38 +2,85 @@
 
 from __future__ import annotations
 
-import io
 import logging
+import os
+import tempfile
 import zipfile
-from pathlib import Path
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import IO, TYPE_CHECKING
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util import Retry
 
 if TYPE_CHECKING:
     from pyscope.course import GSCourse
 
+_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+
+def parse_csrf_token(parsed_resp: BeautifulSoup) -> str | None:
+    """Extract the CSRF token from an already-parsed Gradescope page, if present."""
+    meta = parsed_resp.find("meta", attrs={"name": "csrf-token"})
+    return meta.get("content") if meta else None
+
+
+def _fetch_csrf_token(session: requests.Session, course_url: str) -> str | None:
+    membership_resp = session.get(f"{course_url}/memberships")
+    return parse_csrf_token(BeautifulSoup(membership_resp.text, "html.parser"))
+
 
 def get_csrf_token(course: GSCourse) -> str:
-    """Get the CSRF token for a GradeScope course."""
-    membership_resp = course.session.get(f"{course.url}/memberships")
-    parsed_membership_resp = BeautifulSoup(membership_resp.text, "html.parser")
-    return parsed_membership_resp.find("meta", attrs={"name": "csrf-token"}).get(
-        "content",
-    )
+    """Get the CSRF token for a GradeScope course.
+
+    When the course uses a SafeSession, tokens are cached on it, so the memberships page is only requested when no
+    token for the course has been seen yet (or the cache was invalidated by an authentication error). Other
+    sessions fetch a fresh token every time.
+    """
+    csrf_tokens = getattr(course.session, "csrf_tokens", None)
+    if csrf_tokens is None:
+        return _fetch_csrf_token(course.session, course.url)
+    token = csrf_tokens.get(course.url)
+    if token is None:
+        token = _fetch_csrf_token(course.session, course.url)
+        csrf_tokens[course.url] = token
+    return token
 
 
 def _byte_to_mb(num_bytes: int) -> float:
     return float(num_bytes) / (1024 * 1024)
 
 
+def _extract_all(zip_file: zipfile.ZipFile, write_to: Path) -> None:
+    """Extract every member of a ZIP file, decompressing and writing members on a thread pool.
+
+    ZipFile serializes reads of the underlying file behind a lock, while zlib and file writes release the GIL, so
+    submission bundles with many members extract concurrently from a single ZipFile.
+    """
+    members = zip_file.infolist()
+
+    # ZipFile.extract creates missing directories without exist_ok, so create them up front rather than letting the
+    # workers race. Mirrors the stdlib sanitization of member names (dropping empty, "." and ".." components).
+    directories = set()
+    for member in members:
+        parts = [part for part in PurePosixPath(member.filename).parts if part not in {"/", ".", ".."}]
+        directories.add(write_to.joinpath(*(parts if member.is_dir() else parts[:-1])))
+    for directory in directories:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        # Consume the results so that any extraction error is re-raised here.
+        list(pool.map(lambda member: zip_file.extract(member, write_to), members))
+
+
 def stream_file(
     session: requests.Session,
     url: str,
     write_to: Path | str,
-    chunk_size: int = 8192,
+    chunk_size: int = 1 << 20,
     unzip: bool = True,
     show_bar: bool = True,
 ) -> None:
@@ -50,55 +97,103 @@ def stream_file(
     """
     write_to = Path(write_to)
     with session.get(url, stream=True) as response:
-        total_size = int(response.headers.get("content-length", 0))
-
-        with (
-            io.BytesIO() as file_stream,
-            tqdm(
-                desc="Downloading zip file...",
-                total=total_size,
-                unit="B",
-                unit_scale=True,
-                unit_divisor=1024,
-                disable=not show_bar,
-            ) as bar,
-        ):
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    file_stream.write(chunk)
-                    bar.update(len(chunk))
-
-            logging.debug(
-                "Successfully downloaded %.2f MB",
-                _byte_to_mb(file_stream.getbuffer().nbytes),
-            )
-            file_stream.seek(0)
-            if unzip:
+        if unzip:
+            # Spool the archive to a temporary file once it grows past _SPOOL_MAX_SIZE, rather than holding it all
+            # in memory.
+            with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as file_stream:
+                _download(response, file_stream, chunk_size, show_bar)
+                file_stream.seek(0)
                 with zipfile.ZipFile(file_stream) as zip_file:
-                    zip_file.extractall(write_to)
+                    _extract_all(zip_file, write_to)
                     logging.debug("Files extracted successfully to %s", write_to)
-            else:
-                with write_to.open("wb") as file:
-                    file.write(file_stream.read())
-                logging.debug("File successfull written to: %s", write_to)
+            return
+
+        # Download next to the destination and move it into place once complete, so that a failed download never
+        # leaves a truncated file behind.
+        fd, partial_name = tempfile.mkstemp(dir=write_to.parent, prefix=f".{write_to.name}.", suffix=".part")
+        partial_path = Path(partial_name)
+        try:
+            with os.fdopen(fd, "wb") as file_stream:
+                _download(response, file_stream, chunk_size, show_bar)
+            partial_path.replace(write_to)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+        logging.debug("File successfull written to: %s", write_to)
+
+
+def _download(response: requests.Response, file_stream: IO[bytes], chunk_size: int, show_bar: bool) -> None:
+    with tqdm(
+        desc="Downloading zip file...",
+        total=int(response.headers.get("content-length", 0)),
+        unit="B",
+        unit_scale=True,
+        unit_divisor=1024,
+        disable=not show_bar,
+    ) as bar:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            file_stream.write(chunk)
+            bar.update(len(chunk))
+    logging.debug("Successfully downloaded %.2f MB", _byte_to_mb(file_stream.tell()))
+
+
+def _raise_for_status(response: requests.Response) -> None:
+    """Raise (and log) on HTTP error statuses."""
+    # Compare the status directly; `response.ok` is itself implemented with a try/except around raise_for_status.
+    if response.status_code >= requests.codes.bad_request:
+        logging.error(
+            "Attempted to request %s on %s.\nStatus code: %d",
+            response.request.method,
+            response.url,
+            response.status_code,
+        )
+        # Read the (small) error body, so that streamed responses still release their connection to the pool.
+        _ = response.content
+        response.raise_for_status()
 
 
 class SafeSession(requests.Session):
-    """A thin wrapper around requests.Session that by default checks for errors, and dumps some debug info."""
+    """A thin wrapper around requests.Session that by default checks for errors, and dumps some debug info.
+
+    The status is checked once `requests.Session.request` has returned, after cookies have been extracted and the
+    response has been handled, rather than from a response hook.
+
+    Attributes:
+        csrf_tokens (dict[str, str]): CSRF tokens by course URL, shared by every course using this session.
+
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.csrf_tokens: dict[str, str] = {}
+        self.hooks["response"].append(self._invalidate_csrf_tokens)
+        # Everything goes to the same host, so keep a larger pool of kept-alive connections, and retry
+        # idempotent requests on transient gateway errors. The final response is still returned (and checked
+        # in `request`) rather than raising a RetryError.
+        self.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(502, 503, 504),
+                    raise_on_status=False,
+                ),
+            ),
+        )
 
     def request(self, method: str, url: str, *args, _raise: bool = True, **kwargs) -> requests.Response:  # noqa: ANN002, ANN003, D102
-        response = super().request(method, url, **kwargs)
+        response = super().request(method, url, *args, **kwargs)
         if _raise:
-            try:
-                response.raise_for_status()
-            except requests.exceptions.HTTPError:
-                logging.exception(
-                    "Attempted to request %s on %s with args %s and kwargs %s.\nStatus code: %d",
-                    method,
-                    url,
-                    args,
-                    kwargs,
-                    response.status_code,
-                )
-                raise
+            _raise_for_status(response)
         return response
+
+    def _invalidate_csrf_tokens(self, response: requests.Response, *args, **kwargs) -> None:  # noqa: ANN002, ANN003, ARG002
+        """Response hook that drops cached CSRF tokens once Gradescope rejects a request as unauthorized.
+
+        The failing request is not retried; callers that retry will fetch a fresh token.
+        """
+        if response.status_code in (requests.codes.unauthorized, requests.codes.forbidden):
+            self.csrf_tokens.clear()
@@ -1,6 +1,7 @@
 import argparse
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -12,6 +13,7 @@ from pyscope.course import GSCourse, GSRole
 from pyscope.extension import GSExtension
 
 TEST_COURSE_NAME = "-GRADESCOPE-API-TEST-COURSE-"
+TEST_PDF_PATH = Path(__file__).parent / "test_pdf.pdf"
 
 
 def create_test_course(conn: GSConnection) -> GSCourse:
@@ -19,7 +21,7 @@ def create_test_course(conn: GSConnection) -> GSCourse:
 
     account.delete_classes(course_names=[TEST_COURSE_NAME], ask_for_confirmation=False)
 
-    account.create_course(
+    course = account.create_course(
         name=TEST_COURSE_NAME,
         nickname=TEST_COURSE_NAME,
         description="Dummy course for testing",
@@ -27,11 +29,7 @@ def create_test_course(conn: GSConnection) -> GSCourse:
         year="2026",
         entry_code_enabled=False,
     )
-    matched_courses = account.get_classes(course_names=[TEST_COURSE_NAME], instructor=True)
-    assert len(matched_courses) == 1
-
-    course: GSCourse = matched_courses[0]
-    course.update_roster()
+    assert account.get_classes(course_names=[TEST_COURSE_NAME], instructor=True) == [course]
 
     course.add_person(
         name="Test Person 1",
@@ -39,38 +37,19 @@ def create_test_course(conn: GSConnection) -> GSCourse:
         role=GSRole.STUDENT,
         notify=True,
     )
-    course.change_person_role(name="Test Person 1", new_role=GSRole.READER)
-
-    course.add_person(
-        name="Test Person 2",
-        email="test2@gmail.com",
-        role=GSRole.INSTRUCTOR,
-        sid="123456789",
+    # The remaining additions are independent, so issue them concurrently.
+    course.add_people(
+        [
+            ("Test Person 2", "test2@gmail.com", GSRole.INSTRUCTOR, "123456789"),
+            ("Test Person 3", "test3@gmail.com", GSRole.STUDENT, None),
+            ("Test Person 4", "test4@gmail.com", GSRole.INSTRUCTOR, None),
+            ("Test Person 5", "test5@gmail.com", GSRole.STUDENT, None),
+        ],
         notify=False,
     )
+    course.change_person_role(name="Test Person 1", new_role=GSRole.READER)
     course.change_person_role(name="Test Person 2", new_role=GSRole.STUDENT)
 
-    course.add_person(
-        name="Test Person 3",
-        email="test3@gmail.com",
-        role=GSRole.STUDENT,
-        notify=False,
-    )
-
-    course.add_person(
-        name="Test Person 4",
-        email="test4@gmail.com",
-        role=GSRole.INSTRUCTOR,
-        notify=False,
-    )
-
-    course.add_person(
-        name="Test Person 5",
-        email="test5@gmail.com",
-        role=GSRole.STUDENT,
-        notify=False,
-    )
-
     all_people = course.get_all_people()
     assert len(all_people) == 6, all_people
 
@@ -86,48 +65,49 @@ def create_test_course(conn: GSConnection) -> GSCourse:
 
     all_people = course.get_all_people()
     assert len(all_people) == 4
-    name_to_person = {person.name: person for person in all_people}
-    assert {"Test Person 1", "Test Person 2", "Test Person 5"} <= set(name_to_person.keys())
+    assert {"Test Person 1", "Test Person 2", "Test Person 5"} <= {person.name for person in all_people}
 
     return course
 
 
 def create_test_assignment(course: GSCourse) -> GSAssignment:
-    test_file_path = Path(__file__).parent / "test_pdf.pdf"
     course.add_assignment(
         name="Test Assignment",
         release=datetime.fromisoformat("2022-01-01T00:00"),
         due=datetime.fromisoformat("2022-01-02T00:40"),
-        template_file_path=test_file_path,
+        template_file_path=TEST_PDF_PATH,
     )
     course.add_assignment(
         name="Test Assignment 2",
         release=datetime.fromisoformat("2022-03-05T00:00"),
         due=datetime.fromisoformat("2022-04-08T00:40"),
-        template_file_path=test_file_path,
+        template_file_path=TEST_PDF_PATH,
     )
     course.add_assignment(
         name="Test Assignment 3",
         release=datetime.fromisoformat("2022-03-05T00:00"),
         due=datetime.fromisoformat("2022-04-08T00:40"),
-        template_file_path=test_file_path,
+        template_file_path=TEST_PDF_PATH,
     )
 
     assignments = course.get_all_assignments()
     assert len(assignments) == 3
-    names = [assignment.name for assignment in assignments]
-    assert set(names) == {"Test Assignment", "Test Assignment 2", "Test Assignment 3"}
+    assert {assignment.name for assignment in assignments} == {
+        "Test Assignment",
+        "Test Assignment 2",
+        "Test Assignment 3",
+    }
 
     course.remove_assignment(name="Test Assignment 3", ask_for_confirmation=False)
     assignments = course.get_all_assignments()
     assert len(assignments) == 2
-    names = [assignment.name for assignment in assignments]
-    assert set(names) == {"Test Assignment", "Test Assignment 2"}
+    assert {assignment.name for assignment in assignments} == {"Test Assignment", "Test Assignment 2"}
 
+    now = datetime.now()
     extension = GSExtension.create(
-        release_date=datetime.now(),
-        due_date=datetime.now(),
-        late_due_date=datetime.now(),
+        release_date=now,
+        due_date=now,
+        late_due_date=now,
         time_limit_minutes=10,
     )
 
@@ -136,19 +116,17 @@ def create_test_assignment(course: GSCourse) -> GSAssignment:
     asn.remove_extension(course.get_person(name="Test Person 2").email)
 
     asn = course.get_assignment(name="Test Assignment")
-    asn.apply_extension(extension, student_email="test2@gmail.com")
-
-    extension = GSExtension.create(
-        release_date=datetime.now(),
-        due_date=datetime.now(),
-        late_due_date=datetime.now(),
+    delta_extension = GSExtension.create(
+        release_date=now,
+        due_date=now,
+        late_due_date=now,
         time_limit_minutes=10,
         release_delta=timedelta(days=1),
         due_delta=timedelta(days=1),
         late_due_delta=timedelta(days=100),
         limit_multipler=2,
     )
-    asn.apply_extension(extension, student_email="test5@gmail.com")
+    asn.apply_extensions([(extension, "test2@gmail.com"), (delta_extension, "test5@gmail.com")])
     return asn
 
 
@@ -177,7 +155,7 @@ def add_questions(asn: GSAssignment) -> None:
 
 
 def add_instructor_submission(asn: GSAssignment) -> None:
-    asn.add_instructor_submission(fname=Path(__file__).parent / "test_pdf.pdf")
+    asn.add_instructor_submission(fname=TEST_PDF_PATH)
 
 
 def download_submissions(asn: GSAssignment) -> None:
@@ -202,12 +180,16 @@ def run_tests(course_name: str | None = None, assignment_name: str | None = None
         test_course = create_test_course(conn)
         test_asn = create_test_assignment(test_course)
         add_questions(test_asn)
-        test_asn.add_student_submission(
-            fname=Path(__file__).parent / "test_pdf.pdf",
-            student_email="test5@gmail.com",
-        )
-        test_asn.publish_grades()
-        test_asn.unpublish_grades()
+        # Publishing does not depend on the submission, so toggle it while the upload is in flight.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            upload = executor.submit(
+                test_asn.add_student_submission,
+                fname=TEST_PDF_PATH,
+                student_email="test5@gmail.com",
+            )
+            test_asn.publish_grades()
+            test_asn.unpublish_grades()
+            upload.result()
     test_asn.download_submissions(fname="./export")
     assert Path("./export").exists()
     shutil.rmtree("./export")